@@ -5,12 +5,11 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.requests import Request
 from fastapi.responses import HTMLResponse, Response
 # from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from gh_space_shooter.game import Animator, ColumnStrategy, RandomStrategy, RowStrategy, BaseStrategy
+from gh_space_shooter.game import STRATEGIES, Animator, buffered_frames
 from gh_space_shooter.github_client import GitHubAPIError, GitHubClient
 from gh_space_shooter.output import GifOutputProvider
 
@@ -19,14 +18,16 @@ load_dotenv()
 app = FastAPI(title="GitHub Space Shooter")
 
 templates = Jinja2Templates(directory=Path(__file__).parent / "templates")
+# The landing page has no per-request context, so render it once at startup
+INDEX_HTML = templates.get_template("index.html").render()
 # app.mount("/public", StaticFiles(directory=Path(__file__).parent / "public"), name="public")
 
 
-STRATEGY_MAP: dict[str, type[BaseStrategy]] = {
-    "column": ColumnStrategy,
-    "row": RowStrategy,
-    "random": RandomStrategy,
-}
+INVALID_STRATEGY_DETAIL = f"Invalid strategy. Choose from: {', '.join(STRATEGIES.keys())}"
+
+# The app only serves GIFs; the provider is stateless for encoding, so share one
+GIF_PROVIDER = GifOutputProvider("dummy.gif")
+MEDIA_TYPE = "image/gif"
 
 
 def generate_gif(username: str, strategy: str, token: str) -> bytes:
@@ -34,18 +35,17 @@ def generate_gif(username: str, strategy: str, token: str) -> bytes:
     with GitHubClient(token) as client:
         data = client.get_contribution_graph(username)
 
-    strategy_class: type[BaseStrategy] = STRATEGY_MAP.get(strategy, RandomStrategy)
-    strat = strategy_class()
+    strat = STRATEGIES[strategy]()
 
-    animator = Animator(data, strat, fps=25, watermark=True)
-    provider = GifOutputProvider("dummy.gif")
-    encoded = provider.encode(animator.generate_frames(max_frames=250), frame_duration=1000 // 25)
+    animator = Animator(data, strat, fps=25, watermark=True, quantize=True)
+    frames = buffered_frames(animator.generate_frames(max_frames=250))
+    encoded = GIF_PROVIDER.encode(frames, frame_duration=animator.frame_duration)
     return encoded
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request):
+async def index():
     """Serve the main page."""
-    return templates.TemplateResponse(request, "index.html")
+    return HTMLResponse(content=INDEX_HTML)
 
 
 @app.get("/api/generate")
@@ -54,21 +54,19 @@ async def generate(
     strategy: str = Query("random", description="Animation strategy"),
 ):
     """Generate and return a space shooter animation."""
+    # Reject unknown strategies before doing any other work
+    if strategy not in STRATEGIES:
+        raise HTTPException(status_code=400, detail=INVALID_STRATEGY_DETAIL)
+
     token = os.getenv("GH_TOKEN")
     if not token:
         raise HTTPException(status_code=500, detail="GitHub token not configured")
 
-    if strategy not in STRATEGY_MAP:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid strategy. Choose from: {', '.join(STRATEGY_MAP.keys())}",
-        )
-
     try:
         encoded = generate_gif(username, strategy, token)
         return Response(
             content=encoded,
-            media_type="image/gif",
+            media_type=MEDIA_TYPE,
             headers={
                 "Response-Type": "blob",
                 "Content-Disposition": f"inline; filename={username}-space-shooter.gif"
@@ -3,7 +3,6 @@
 import json
 import os
 import sys
-from pathlib import Path
 
 import typer
 from dotenv import load_dotenv
@@ -11,10 +10,10 @@ from rich.console import Console
 
 from .constants import DEFAULT_FPS
 from .console_printer import ContributionConsolePrinter
-from .game import Animator, ColumnStrategy, RandomStrategy, RowStrategy, BaseStrategy
+from .game import STRATEGIES, Animator, buffered_frames
 from .github_client import ContributionData, GitHubAPIError, GitHubClient
 from .output import resolve_output_provider
-from .output import OutputProvider, WebpDataUrlOutputProvider
+from .output import GifOutputProvider, OutputProvider, WebpDataUrlOutputProvider
 
 # Load environment variables from .env file
 load_dotenv()
@@ -191,22 +190,20 @@ def _resolve_provider(file_path: str, is_dataurl: bool) -> OutputProvider:
         raise CLIError(str(e))
 
 
-def _setup_animator(strategy_name: str, data: ContributionData, fps: int, watermark: bool) -> Animator:
+def _setup_animator(
+    strategy_name: str, data: ContributionData, fps: int, watermark: bool, quantize: bool = False
+) -> Animator:
     """
     Set up strategy and animator.
     """
-    if strategy_name == "column":
-        strategy: BaseStrategy = ColumnStrategy()
-    elif strategy_name == "row":
-        strategy = RowStrategy()
-    elif strategy_name == "random":
-        strategy = RandomStrategy()
-    else:
+    strategy_class = STRATEGIES.get(strategy_name)
+    if strategy_class is None:
         raise CLIError(
-            f"Unknown strategy '{strategy_name}'. Available: column, row, random"
+            f"Unknown strategy '{strategy_name}'. Available: {', '.join(STRATEGIES)}"
         )
+    strategy = strategy_class()
 
-    return Animator(data, strategy, fps=fps, watermark=watermark)
+    return Animator(data, strategy, fps=fps, watermark=watermark, quantize=quantize)
 
 
 def _generate_output(
@@ -231,33 +228,36 @@ def _generate_output(
     Raises:
         CLIError: If output generation fails
     """
+    ext = os.path.splitext(provider.path)[1][1:].upper()
+
+    # Setup strategy and animator
+    # Only GIF needs a palette; other formats keep full RGB frames
+    quantize = isinstance(provider, GifOutputProvider)
+    animator = _setup_animator(strategy_name, data, fps, watermark, quantize)
+
     # Warn about GIF FPS limitation
-    if provider.path.endswith(".gif") and fps > 50:
+    if ext == "GIF" and fps > 50:
         console.print(
             f"[yellow]Warning:[/yellow] FPS > 50 may not display correctly in browsers "
-            f"(GIF delay will be {1000 // fps}ms, but browsers clamp delays < 20ms to ~100ms)"
+            f"(GIF delay will be {animator.frame_duration}ms, but browsers clamp delays < 20ms to ~100ms)"
         )
 
     # Print generation message
     if isinstance(provider, WebpDataUrlOutputProvider):
         console.print("\n[bold blue]Generating WebP data URL...[/bold blue]")
     else:
-        ext = Path(provider.path).suffix[1:].upper()
         console.print(f"\n[bold blue]Generating {ext} animation...[/bold blue]")
 
-    # Setup strategy and animator
-    animator = _setup_animator(strategy_name, data, fps, watermark)
-
     # Encode and write
     try:
-        encoded = provider.encode(animator.generate_frames(max_frames), 1000 // fps)
+        frames = buffered_frames(animator.generate_frames(max_frames))
+        encoded = provider.encode(frames, animator.frame_duration)
         provider.write(encoded)
 
         # Console output based on provider type
         if isinstance(provider, WebpDataUrlOutputProvider):
             console.print(f"[green]✓[/green] Data URL written to {provider.path}")
         else:
-            ext = Path(provider.path).suffix[1:].upper()
             console.print(f"[green]✓[/green] {ext} saved to {provider.path}")
     except Exception as e:
         raise CLIError(f"Failed to generate output: {e}")
@@ -32,3 +32,4 @@ EXPLOSION_DURATION_SMALL = 0.12  # Seconds for small explosion animation
 # Starfield settings (speeds in cells per second)
 STAR_SPEED_MIN = 1.0  # Minimum star speed (dimmer/farther stars)
 STAR_SPEED_MAX = 2.5  # Maximum star speed (brighter/closer stars)
+STAR_BRIGHTNESS_LEVELS = 16  # Distinct star colors, so stars can be drawn in batches
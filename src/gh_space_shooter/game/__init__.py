@@ -1,9 +1,10 @@
 """Game animation module for GitHub contribution visualization."""
 
-from .animator import Animator
+from .animator import Animator, buffered_frames
 from .drawables import Bullet, Drawable, Enemy, Explosion, Ship, Starfield
 from .game_state import GameState
 from .renderer import Renderer
+from .strategies import STRATEGIES
 from .strategies.base_strategy import Action, BaseStrategy
 from .strategies.column_strategy import ColumnStrategy
 from .strategies.random_strategy import RandomStrategy
@@ -11,6 +12,7 @@ from .strategies.row_strategy import RowStrategy
 
 __all__ = [
     "Animator",
+    "buffered_frames",
     "Bullet",
     "Drawable",
     "Enemy",
@@ -24,4 +26,5 @@ __all__ = [
     "ColumnStrategy",
     "RowStrategy",
     "RandomStrategy",
+    "STRATEGIES",
 ]
@@ -1,6 +1,9 @@
 """Animator for generating GIF animations from game strategies."""
 
+import queue
+import threading
 from io import BytesIO
+from itertools import islice
 from typing import Iterator
 
 from PIL import Image
@@ -11,6 +14,59 @@ from .renderer import Renderer
 from .strategies.base_strategy import BaseStrategy
 from .render_context import RenderContext
 
+_BUFFER_DONE = object()
+
+
+def buffered_frames(frames: Iterator[Image.Image], maxsize: int = 8) -> Iterator[Image.Image]:
+    """
+    Produce frames on a background thread so rendering overlaps with encoding.
+
+    Pillow releases the GIL while quantizing and compressing, so the encoder
+    can consume one frame while the next one is being simulated and drawn.
+
+    Args:
+        frames: Iterator of frames to drain on the worker thread
+        maxsize: Maximum number of frames buffered ahead of the consumer
+
+    Returns:
+        Iterator yielding the same frames in order
+    """
+    buffer: queue.Queue = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(item: object) -> None:
+        # Poll so the worker exits if the consumer stops early
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        try:
+            for frame in frames:
+                if stop.is_set():
+                    return
+                put(frame)
+        except BaseException as e:
+            put(e)
+        else:
+            put(_BUFFER_DONE)
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _BUFFER_DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
 
 class Animator:
     """Generates animated GIFs from game strategies."""
@@ -21,6 +77,7 @@ class Animator:
         strategy: BaseStrategy,
         fps: int,
         watermark: bool = False,
+        quantize: bool = False,
     ):
         """
         Initialize animator.
@@ -30,11 +87,13 @@ class Animator:
             strategy: The strategy to use for clearing enemies
             fps: Frames per second for the animation
             watermark: Whether to add watermark to the GIF
+            quantize: Whether to emit frames pre-quantized onto a shared palette (GIF only)
         """
         self.contribution_data = contribution_data
         self.strategy = strategy
         self.fps = fps
         self.watermark = watermark
+        self.quantize = quantize
         self.frame_duration = 1000 // fps
         # Delta time in seconds per frame
         # Used to scale all speeds (cells/second) to per-frame movement
@@ -44,20 +103,19 @@ class Animator:
         """
         Generate all animation frames.
 
+        Args:
+            max_frames: Stop after this many frames (None for the full animation)
+
         Returns:
             Iterator of PIL Images representing animation frames
         """
         game_state = GameState(self.contribution_data)
-        renderer = Renderer(game_state, RenderContext.darkmode(), watermark=self.watermark)
-        
-        if max_frames is not None:
-            gen = self._generate_frames(game_state, renderer)
-            while max_frames > 0:
-                max_frames -= 1
-                yield next(gen)
-        else:
-            yield from self._generate_frames(game_state, renderer)
-        
+        renderer = Renderer(
+            game_state, RenderContext.darkmode(), watermark=self.watermark, quantize=self.quantize
+        )
+
+        # Frames are simulated lazily, so stopping here also stops the simulation
+        yield from islice(self._generate_frames(game_state, renderer), max_frames)
 
     def _generate_frames(
         self, game_state: GameState, renderer: Renderer
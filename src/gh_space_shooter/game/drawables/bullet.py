@@ -1,5 +1,6 @@
 """Bullet objects fired by the ship."""
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from PIL import ImageDraw
@@ -28,17 +29,18 @@ class Bullet(Drawable):
         self.x = x
         self.y: float = SHIP_POSITION_Y - 1
         self.game_state = game_state
+        self.dead = False  # Swept out of game_state.bullets after the frame
 
 
     def _check_collision(self) -> "Enemy | None":
         """Check if bullet has hit an enemy at its current position."""
-        for enemy in self.game_state.enemies:
-            if enemy.x == self.x and enemy.y >= self.y:
+        for enemy in self.game_state.enemies_by_x.get(self.x, ()):
+            if enemy.y >= self.y:
                 return enemy
         return None
 
     def animate(self, delta_time: float) -> None:
-        """Update bullet position, check for collisions, and remove on hit.
+        """Update bullet position, check for collisions, and mark dead on hit.
 
         Args:
             delta_time: Time elapsed since last frame in seconds.
@@ -49,38 +51,37 @@ class Bullet(Drawable):
             explosion = Explosion(self.x, self.y, "small", self.game_state)
             self.game_state.explosions.append(explosion)
             hit_enemy.take_damage()
-            self.game_state.bullets.remove(self)
+            self.dead = True
         if self.y < -10:  # magic number to remove off-screen bullets
-            self.game_state.bullets.remove(self)
+            self.dead = True
 
     def draw(self, draw: ImageDraw.ImageDraw, context: "RenderContext") -> None:
         """Draw the bullet with trailing tail effect."""
-
-        for i in range(BULLET_TRAILING_LENGTH):
-            trail_y = self.y + (i + 1) * BULLET_TRAIL_SPACING
-            fade_factor = (i + 1) / BULLET_TRAILING_LENGTH / 2
-            self._draw_bullet(draw, context, (self.x, trail_y), fade_factor=fade_factor)
-
-        self._draw_bullet(draw, context, (self.x, self.y), fade_factor=0.3, offset=.6)
-        self._draw_bullet(draw, context, (self.x, self.y), fade_factor=0.4, offset=.4)
-        self._draw_bullet(draw, context, (self.x, self.y), fade_factor=0.5, offset=.2)
-        self._draw_bullet(draw, context, (self.x, self.y))
-
-    def _draw_bullet(
-        self,
-        draw: ImageDraw.ImageDraw,
-        context: "RenderContext",
-        position: tuple[float, float],
-        fade_factor: float = 1,
-        offset: float = 0
-    ) -> None:
-        x, y = context.get_cell_position(position[0], position[1])
-        x += context.cell_size // 2
-        y += context.cell_size // 2
-
-        r_x = 0.5 + offset
-        r_y = 4 + offset
-        draw.rectangle(
-            [x - r_x, y - r_y, x + r_x, y + r_y],
-            fill=(*context.bullet_color, int(fade_factor * 255)),
-        )
+        # Pixel column and color are shared by every segment of the bullet
+        x = context.padding + self.x * context.cell_pitch + context.cell_size // 2
+        half_cell = context.cell_size // 2
+        for trail_offset, fill, r_x, r_y in _bullet_segments(context.bullet_color):
+            y = context.padding + (self.y + trail_offset) * context.cell_pitch + half_cell
+            draw.rectangle([x - r_x, y - r_y, x + r_x, y + r_y], fill=fill)
+
+
+@lru_cache(maxsize=4)
+def _bullet_segments(
+    bullet_color: tuple[int, int, int],
+) -> tuple[tuple[float, tuple[int, int, int, int], float, float], ...]:
+    """
+    Build the bullet's rectangles in draw order: fading tail, glow, then core.
+
+    Returns:
+        Tuples of (y offset in cells, RGBA fill, half width, half height)
+    """
+    segments = []
+    for i in range(BULLET_TRAILING_LENGTH):
+        fade_factor = (i + 1) / BULLET_TRAILING_LENGTH / 2
+        segments.append(((i + 1) * BULLET_TRAIL_SPACING, fade_factor, 0.0))
+    segments += [(0, 0.3, .6), (0, 0.4, .4), (0, 0.5, .2), (0, 1, 0)]
+
+    return tuple(
+        (trail_offset, (*bullet_color, int(fade_factor * 255)), 0.5 + offset, 4 + offset)
+        for trail_offset, fade_factor, offset in segments
+    )
@@ -1,8 +1,9 @@
 """Enemy objects representing contribution graph data."""
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
 from .drawable import Drawable
 from .explosion import Explosion
@@ -11,6 +12,20 @@ if TYPE_CHECKING:
     from ..game_state import GameState
     from ..render_context import RenderContext
 
+ENEMY_CORNER_RADIUS = 2
+
+
+@lru_cache(maxsize=8)
+def _enemy_mask(cell_size: int) -> Image.Image:
+    """Render the rounded enemy shape once as a bitmap mask."""
+    mask = Image.new("1", (cell_size + 1, cell_size + 1), 0)
+    ImageDraw.Draw(mask).rounded_rectangle(
+        [0, 0, cell_size, cell_size],
+        radius=ENEMY_CORNER_RADIUS,
+        fill=1,
+    )
+    return mask
+
 
 class Enemy(Drawable):
     """Represents an enemy at a specific position."""
@@ -40,7 +55,7 @@ class Enemy(Drawable):
             # Create large explosion with green color (enemy color)
             explosion = Explosion(self.x, self.y, "large", self.game_state)
             self.game_state.explosions.append(explosion)
-            self.game_state.enemies.remove(self)
+            self.game_state.remove_enemy(self)
 
     def animate(self, delta_time: float) -> None:
         """Update enemy state for next frame (enemies don't animate currently)."""
@@ -48,11 +63,11 @@ class Enemy(Drawable):
 
     def draw(self, draw: ImageDraw.ImageDraw, context: "RenderContext") -> None:
         """Draw the enemy at its position with rounded corners."""
-        x, y = context.get_cell_position(self.x, self.y)
-        color = context.enemy_colors.get(self.health, context.enemy_colors[1])
-
-        draw.rounded_rectangle(
-            [x, y, x + context.cell_size, y + context.cell_size],
-            radius=2,
-            fill=color,
-        )
+        # Enemies sit on whole cells, so look their pixel position up directly
+        offsets = context.cell_offsets
+        x, y = offsets[self.x], offsets[self.y]
+        colors = context.enemy_color_table
+        color = colors[self.health] if self.health < len(colors) else colors[1]
+
+        # Stamp the cached shape instead of rebuilding corner arcs every frame
+        draw.bitmap((x, y), _enemy_mask(context.cell_size), fill=color)
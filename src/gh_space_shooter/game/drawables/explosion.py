@@ -32,7 +32,7 @@ class Explosion(Drawable):
             x: X position (week, 0-51)
             y: Y position (day, 0-6)
             size: "small" for bullet hits, "large" for enemy destruction
-            game_state: Reference to game state for self-removal
+            game_state: Reference to game state the explosion is shown in
         """
         self.x = x
         self.y = y
@@ -41,17 +41,21 @@ class Explosion(Drawable):
         self.duration = EXPLOSION_DURATION_SMALL if size == "small" else EXPLOSION_DURATION_LARGE
         self.max_radius = EXPLOSION_MAX_RADIUS_SMALL if size == "small" else EXPLOSION_MAX_RADIUS_LARGE
         self.particle_count = EXPLOSION_PARTICLE_COUNT_SMALL if size == "small" else EXPLOSION_PARTICLE_COUNT_LARGE
-        self.particle_angles = [random.uniform(0, 2 * math.pi) for _ in range(self.particle_count)]
+        # Unit direction of each particle, fixed for the explosion's lifetime,
+        # so drawing needs no trig per frame
+        angles = (random.uniform(0, 2 * math.pi) for _ in range(self.particle_count))
+        self.particle_directions = tuple((math.cos(angle), math.sin(angle)) for angle in angles)
+        self.dead = False  # Swept out of game_state.explosions after the frame
 
     def animate(self, delta_time: float) -> None:
-        """Progress the explosion animation and remove when complete.
+        """Progress the explosion animation and mark dead when complete.
 
         Args:
             delta_time: Time elapsed since last frame in seconds.
         """
         self.elapsed_time += delta_time
         if self.elapsed_time >= self.duration:
-            self.game_state.explosions.remove(self)
+            self.dead = True
 
     def draw(self, draw: ImageDraw.ImageDraw, context: "RenderContext") -> None:
         """Draw expanding particle explosion with fade effect."""
@@ -59,22 +63,23 @@ class Explosion(Drawable):
         progress = self.elapsed_time / self.duration
         fade = 1 - progress  # Fade out as animation progresses
 
-        center_x, center_y = context.get_cell_position(self.x, self.y)
-        center_x += context.cell_size // 2
-        center_y += context.cell_size // 2
-
-        for i in range(self.particle_count):
-            distance = progress * self.max_radius
-            angle = self.particle_angles[i]
+        # Distance, size and color are the same for every particle this frame
+        distance = progress * self.max_radius
+        # Particle size decreases as it expands
+        particle_size = int((1 - progress * 0.5) * 3) + 1
+        color = (*context.bullet_color, int(255 * fade))
 
-            px = int(center_x + distance * math.cos(angle))
-            py = int(center_y + distance * math.sin(angle))
+        center_x, center_y = context.get_cell_position(self.x, self.y)
+        half_cell = context.cell_size // 2
+        center_x += half_cell
+        center_y += half_cell
 
-            # Particle size decreases as it expands
-            particle_size = int((1 - progress * 0.5) * 3) + 1
+        for dx, dy in self.particle_directions:
+            px = int(center_x + distance * dx)
+            py = int(center_y + distance * dy)
 
             draw.rectangle(
                 [px - particle_size, py - particle_size,
                  px + particle_size, py + particle_size],
-                fill=(*context.bullet_color, int(255 * fade))
+                fill=color
             )
@@ -1,8 +1,10 @@
 """Player ship object."""
 
+import math
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
 from ...constants import SHIP_POSITION_Y, SHIP_SPEED
 from .drawable import Drawable
@@ -11,6 +13,9 @@ if TYPE_CHECKING:
     from ..game_state import GameState
     from ..render_context import RenderContext
 
+# Columns kept on each side of the ship center in the cached masks
+SHIP_SPRITE_MARGIN = 10
+
 
 class Ship(Drawable):
     """Represents the player's ship."""
@@ -58,55 +63,91 @@ class Ship(Drawable):
     def draw(self, draw: ImageDraw.ImageDraw, context: "RenderContext") -> None:
         """Draw a simple Galaga-style ship."""
         x, y = context.get_cell_position(self.x, SHIP_POSITION_Y)
-
-        # Calculate ship dimensions
         center_x = x + context.cell_size // 2
-        height = context.cell_size
-        wing_width = 8
-
-        # Draw left wing
-        draw.polygon(
-            [
-                (center_x - 2, y + height * 0.5),
-                (center_x - wing_width, y + height * 0.8),
-                (center_x - wing_width, y + height * 1),
-                (center_x - 2, y + height * 0.7),
-            ],
-            fill=(*context.ship_color, 128)
-        )
-        draw.rectangle(
-            [
-                center_x - wing_width - 1, y + height * 0.5,
-                center_x - wing_width, y + height * 1, 
-            ],
-            fill=context.ship_color
-        )
-
-        # Draw right wing
-        draw.polygon(
-            [
-                (center_x + 2, y + height * 0.5),
-                (center_x + wing_width, y + height * 0.8),
-                (center_x + wing_width, y + height * 1),
-                (center_x + 2, y + height * 0.7),
-            ],
-            fill=(*context.ship_color, 128)
-        )
-        draw.rectangle(
-            [
-                center_x + wing_width, y + height * 0.5, 
-                center_x + wing_width + 1, y + height * 1
-            ],
-            fill=context.ship_color
-        )
-
-
-        draw.polygon(
-            [
-                (center_x, y),
-                (center_x - 3, y + height * 0.7),
-                (center_x, y + height),
-                (center_x + 3, y + height * 0.7),
-            ],
-            fill=context.ship_color
-        )
+
+        # Stamp the cached ship shape; only its sub-pixel offset changes the raster
+        left = math.floor(center_x) - SHIP_SPRITE_MARGIN
+        wings, body = _ship_masks(context.cell_size, center_x - left)
+        draw.bitmap((left, y), wings, fill=(*context.ship_color, 128))
+        draw.bitmap((left, y), body, fill=context.ship_color)
+
+
+@lru_cache(maxsize=32)
+def _ship_masks(cell_size: int, center_x: float) -> tuple[Image.Image, Image.Image]:
+    """
+    Rasterize the ship once for a given horizontal sub-pixel position.
+
+    center_x is a float, but it is only the fractional part of the ship
+    center plus SHIP_SPRITE_MARGIN. The ship moves a fixed step per frame
+    and settles on whole cells, so the same few offsets repeat in every
+    cell pitch. That is 2 keys at 25 fps and 16 at 40 fps, so maxsize=32
+    keeps them all. At higher frame rates float drift adds keys, and the
+    extra ones just miss and get rasterized again.
+
+    Args:
+        cell_size: Size of a grid cell in pixels
+        center_x: Ship center measured from the left edge of the masks
+
+    Returns:
+        Masks of the translucent wing pixels and of the opaque pixels
+    """
+    sprite = Image.new("RGBA", (2 * SHIP_SPRITE_MARGIN + 2, cell_size + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite, "RGBA")
+    y = 0
+    height = cell_size
+    wing_width = 8
+    translucent = (255, 255, 255, 128)
+    opaque = (255, 255, 255, 255)
+
+    # Draw left wing
+    draw.polygon(
+        [
+            (center_x - 2, y + height * 0.5),
+            (center_x - wing_width, y + height * 0.8),
+            (center_x - wing_width, y + height * 1),
+            (center_x - 2, y + height * 0.7),
+        ],
+        fill=translucent
+    )
+    draw.rectangle(
+        [
+            center_x - wing_width - 1, y + height * 0.5,
+            center_x - wing_width, y + height * 1,
+        ],
+        fill=opaque
+    )
+
+    # Draw right wing
+    draw.polygon(
+        [
+            (center_x + 2, y + height * 0.5),
+            (center_x + wing_width, y + height * 0.8),
+            (center_x + wing_width, y + height * 1),
+            (center_x + 2, y + height * 0.7),
+        ],
+        fill=translucent
+    )
+    draw.rectangle(
+        [
+            center_x + wing_width, y + height * 0.5,
+            center_x + wing_width + 1, y + height * 1
+        ],
+        fill=opaque
+    )
+
+    # Draw body
+    draw.polygon(
+        [
+            (center_x, y),
+            (center_x - 3, y + height * 0.7),
+            (center_x, y + height),
+            (center_x + 3, y + height * 0.7),
+        ],
+        fill=opaque
+    )
+
+    # Later shapes overwrite earlier ones, so split pixels by their final alpha
+    alpha = sprite.getchannel("A")
+    wings = alpha.point(lambda value: 255 if value == 128 else 0).convert("1")
+    body = alpha.point(lambda value: 255 if value == 255 else 0).convert("1")
+    return wings, body
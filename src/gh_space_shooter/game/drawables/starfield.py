@@ -1,22 +1,31 @@
 """Animated starfield background."""
 
 import random
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING
 
 from PIL import ImageDraw
 
-from ...constants import NUM_WEEKS, SHIP_POSITION_Y, STAR_SPEED_MIN, STAR_SPEED_MAX
+from ...constants import (
+    NUM_WEEKS,
+    SHIP_POSITION_Y,
+    STAR_BRIGHTNESS_LEVELS,
+    STAR_SPEED_MAX,
+    STAR_SPEED_MIN,
+)
 from .drawable import Drawable
 
 if TYPE_CHECKING:
     from ..render_context import RenderContext
 
-class Star(TypedDict):
-    x: float
-    y: float
-    brightness: float
-    size: int
-    speed: float
+
+# Every white a star can be drawn with, from dimmest (0.2) to brightest (1.0)
+STAR_COLORS: tuple[tuple[int, int, int, int], ...] = tuple(
+    (grey, grey, grey, 255)
+    for grey in (
+        int(255 * (0.2 + level * 0.8 / (STAR_BRIGHTNESS_LEVELS - 1)))
+        for level in range(STAR_BRIGHTNESS_LEVELS)
+    )
+)
 
 
 class Starfield(Drawable):
@@ -24,7 +33,13 @@ class Starfield(Drawable):
 
     def __init__(self) -> None:
         """Initialize the starfield with random stars."""
-        self.stars: list[Star] = []
+        # Star attributes live in parallel lists indexed by star, so the
+        # per-frame loops walk flat lists instead of per-star dicts
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        self.sizes: list[int] = []
+        self.speeds: list[float] = []
+        self.colors: list[tuple[int, int, int, int]] = []
         # Generate about 100 stars across the play area
         for _ in range(100):
             # Random position across the entire grid area
@@ -36,9 +51,13 @@ class Starfield(Drawable):
             size = random.choice([1, 1, 1, 2])  # More 1-pixel stars
             # Speed: slower for dimmer (farther) stars (in cells per second)
             speed = STAR_SPEED_MIN + (brightness * (STAR_SPEED_MAX - STAR_SPEED_MIN))
-            self.stars.append(
-                {"x": x, "y": y, "brightness": brightness, "size": size, "speed": speed}
-            )
+            self.xs.append(x)
+            self.ys.append(y)
+            self.sizes.append(size)
+            self.speeds.append(speed)
+            self.colors.append(_star_color(brightness))
+        # Star colors never change, so the set of draw.point groups is fixed
+        self.distinct_colors = tuple(dict.fromkeys(self.colors))
 
     def animate(self, delta_time: float) -> None:
         """Move stars downward, wrapping around when they go off screen.
@@ -46,36 +65,43 @@ class Starfield(Drawable):
         Args:
             delta_time: Time elapsed since last frame in seconds.
         """
-        for star in self.stars:
-            star["y"] += star["speed"] * delta_time
+        xs = self.xs
+        ys = self.ys
+        bottom = SHIP_POSITION_Y + 4
+        for i, speed in enumerate(self.speeds):
+            y = ys[i] + speed * delta_time
 
             # Wrap around: if star goes below the screen, move it back to the top
-            if star["y"] > SHIP_POSITION_Y + 4:
-                star["y"] = -2
+            if y > bottom:
+                y = -2
                 # Randomize x position when wrapping for variety
-                star["x"] = random.uniform(-2, NUM_WEEKS + 2)
+                xs[i] = random.uniform(-2, NUM_WEEKS + 2)
+            ys[i] = y
 
     def draw(self, draw: ImageDraw.ImageDraw, context: "RenderContext") -> None:
         """Draw all stars at their current positions."""
-        for star in self.stars:
-            star_x = star["x"]
-            star_y = star["y"]
-            brightness = star["brightness"]
-            size = star["size"]
-            # Convert grid position to pixel position
-            x, y = context.get_cell_position(star_x, star_y)
-
-            # Calculate star color (white with varying brightness)
-            star_brightness = int(255 * brightness)
-            star_color = (star_brightness, star_brightness, star_brightness, 255)
-
-            # Draw star as a small rectangle or point
+        # Collect pixels per color so each color is a single draw.point call
+        points_by_color: dict[tuple[int, int, int, int], list[tuple[float, float]]] = {
+            color: [] for color in self.distinct_colors
+        }
+        padding, pitch = context.padding, context.cell_pitch
+        for star_x, star_y, color, size in zip(self.xs, self.ys, self.colors, self.sizes):
+            # Convert grid position to pixel position (inlined get_cell_position)
+            x = padding + star_x * pitch
+            y = padding + star_y * pitch
+
+            points = points_by_color[color]
             if size == 1:
                 # Single pixel star
-                draw.point([(x, y)], fill=star_color)
+                points.append((x, y))
             else:
                 # Slightly larger star (2x2)
-                draw.rectangle(
-                    [x, y, x + size - 1, y + size - 1],
-                    fill=star_color
-                )
+                points += [(x, y), (x + 1, y), (x, y + 1), (x + 1, y + 1)]
+
+        for star_color, points in points_by_color.items():
+            draw.point(points, fill=star_color)
+
+
+def _star_color(brightness: float) -> tuple[int, int, int, int]:
+    """White star color for a brightness in 0.2-1.0, snapped to a few levels."""
+    return STAR_COLORS[round((brightness - 0.2) / 0.8 * (STAR_BRIGHTNESS_LEVELS - 1))]
@@ -1,6 +1,6 @@
 """Game state management for tracking enemies, ship, and bullets."""
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List, TypeVar
 
 from PIL import ImageDraw
 
@@ -11,6 +11,8 @@ from .drawables import Bullet, Drawable, Enemy, Explosion, Ship, Starfield
 if TYPE_CHECKING:
     from .render_context import RenderContext
 
+_Entity = TypeVar("_Entity", Bullet, Explosion)
+
 
 class GameState(Drawable):
     """Manages the current state of the game."""
@@ -25,6 +27,8 @@ class GameState(Drawable):
         self.starfield = Starfield()
         self.ship = Ship(self)
         self.enemies: List[Enemy] = []
+        # Enemies grouped by column, so bullets only check their own column
+        self.enemies_by_x: Dict[int, List[Enemy]] = {}
         self.bullets: List[Bullet] = []
         self.explosions: List[Explosion] = []
 
@@ -39,7 +43,20 @@ class GameState(Drawable):
                 if level <= 0:
                     continue
                 enemy = Enemy(x=week_idx, y=day_idx, health=level, game_state=self)
-                self.enemies.append(enemy)
+                self.add_enemy(enemy)
+
+    def add_enemy(self, enemy: Enemy) -> None:
+        """Add an enemy to the game and to its column index."""
+        self.enemies.append(enemy)
+        self.enemies_by_x.setdefault(enemy.x, []).append(enemy)
+
+    def remove_enemy(self, enemy: Enemy) -> None:
+        """Remove a destroyed enemy from the game and from its column index."""
+        self.enemies.remove(enemy)
+        column = self.enemies_by_x[enemy.x]
+        column.remove(enemy)
+        if not column:
+            del self.enemies_by_x[enemy.x]
 
     def shoot(self) -> None:
         """
@@ -65,12 +82,9 @@ class GameState(Drawable):
         """
         self.starfield.animate(delta_time)
         self.ship.animate(delta_time)
-        for enemy in self.enemies:
-            enemy.animate(delta_time)
-        for bullet in self.bullets:
-            bullet.animate(delta_time)
-        for explosion in self.explosions:
-            explosion.animate(delta_time)
+        # Enemies are static (Enemy.animate is a no-op), so they are not stepped
+        self.bullets = _animate_entities(self.bullets, delta_time)
+        self.explosions = _animate_entities(self.explosions, delta_time)
 
     def draw(self, draw: ImageDraw.ImageDraw, context: "RenderContext") -> None:
         """Draw all game objects including the grid."""
@@ -82,3 +96,24 @@ class GameState(Drawable):
         for bullet in self.bullets:
             bullet.draw(draw, context)
         self.ship.draw(draw, context)
+
+
+def _animate_entities(entities: List[_Entity], delta_time: float) -> List[_Entity]:
+    """
+    Animate bullets or explosions and drop the ones that died this frame.
+
+    Entities only flag themselves as dead while animating; the list is swept
+    once afterwards, and only rebuilt when something actually died.
+
+    Args:
+        entities: Entities with a ``dead`` flag
+        delta_time: Time elapsed since last frame in seconds
+
+    Returns:
+        The surviving entities (the same list if none died)
+    """
+    for entity in entities:
+        entity.animate(delta_time)
+    if any(entity.dead for entity in entities):
+        return [entity for entity in entities if not entity.dead]
+    return entities
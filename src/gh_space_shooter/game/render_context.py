@@ -1,8 +1,11 @@
 """Rendering context for drawable objects."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Tuple
 
+from ..constants import NUM_WEEKS
+
 
 @dataclass
 class RenderContext:
@@ -25,6 +28,24 @@ class RenderContext:
     bullet_color: Tuple[int, int, int]
     enemy_colors: dict[int, Tuple[int, int, int]]  # Maps health level to color
 
+    @cached_property
+    def enemy_color_table(self) -> tuple[Tuple[int, int, int], ...]:
+        """Enemy colors indexed by health; unknown levels use the level-1 color."""
+        fallback = self.enemy_colors[1]
+        return tuple(
+            self.enemy_colors.get(health, fallback) for health in range(max(self.enemy_colors) + 1)
+        )
+
+    @cached_property
+    def cell_pitch(self) -> int:
+        """Distance in pixels from one cell to the next."""
+        return self.cell_size + self.cell_spacing
+
+    @cached_property
+    def cell_offsets(self) -> tuple[int, ...]:
+        """Pixel offset of every whole grid cell, indexed by week or day."""
+        return tuple(self.padding + i * self.cell_pitch for i in range(NUM_WEEKS))
+
     def get_cell_position(self, x: float, y: float) -> tuple[float, float]:
         """
         Get the pixel position (x, y) for a grid coordinate.
@@ -37,8 +58,8 @@ class RenderContext:
             Tuple of (x, y) pixel coordinates
         """
         return (
-            self.padding + x * (self.cell_size + self.cell_spacing),
-            self.padding + y * (self.cell_size + self.cell_spacing),
+            self.padding + x * self.cell_pitch,
+            self.padding + y * self.cell_pitch,
         )
 
     @staticmethod
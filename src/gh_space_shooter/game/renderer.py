@@ -3,15 +3,23 @@
 from PIL import Image, ImageDraw, ImageFont
 
 from ..constants import NUM_WEEKS, SHIP_POSITION_Y
+from .drawables.starfield import STAR_COLORS
 from .game_state import GameState
 from .render_context import RenderContext
 
 WATERMARK_TEXT = "by czl9707/gh-space-shooter"
+WATERMARK_COLOR = (100, 100, 100, 128)  # Semi-transparent gray
 
 
 class Renderer:
     """Renders game state as PIL Images."""
-    def __init__(self, game_state: GameState, render_context: RenderContext, watermark: bool = False):
+    def __init__(
+        self,
+        game_state: GameState,
+        render_context: RenderContext,
+        watermark: bool = False,
+        quantize: bool = False,
+    ):
         """
         Initialize renderer.
 
@@ -19,6 +27,7 @@ class Renderer:
             game_state: The game state to render
             render_context: Rendering configuration and theming
             watermark: Whether to add watermark to frames
+            quantize: Whether to map frames onto the shared palette (for GIF output)
         """
         self.game_state = game_state
         self.context = render_context
@@ -28,43 +37,112 @@ class Renderer:
         self.grid_height = SHIP_POSITION_Y * (self.context.cell_size + self.context.cell_spacing)
         self.width = self.grid_width + 2 * self.context.padding
         self.height = self.grid_height + 2 * self.context.padding
+        self.palette = build_palette(self.context) if quantize else None
+
+        # The watermark never changes, so prepare it once
+        self._watermark_mask, self._watermark_position = self._build_watermark()
+
+        # Scratch buffers reused by every frame; render_frame always returns a
+        # new image, so nothing handed out ever aliases them
+        self._overlay = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
+        self._overlay_draw = ImageDraw.Draw(self._overlay, "RGBA")
+        self._frame = Image.new("RGB", (self.width, self.height), self.context.background_color)
 
     def render_frame(self) -> Image.Image:
         """
         Render the current game state as an image.
 
         Returns:
-            PIL Image of the current frame
+            PIL Image of the current frame, in RGB mode, or in "P" mode using
+            the shared palette when quantizing
         """
-        # Create image with background color
-        img = Image.new("RGB", (self.width, self.height), self.context.background_color)
+        box = (0, 0, self.width, self.height)
+        overlay = self._overlay
+        draw = self._overlay_draw
+        overlay.paste((0, 0, 0, 0), box)
 
         # Draw game state
-        overlay = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay, "RGBA")
         self.game_state.draw(draw, self.context)
 
         # Draw watermark if enabled
         if self.watermark:
             self._draw_watermark(draw)
 
-        combined = Image.alpha_composite(img.convert("RGBA"), overlay)
+        # Blend the overlay onto the RGB background in one pass,
+        # instead of compositing in RGBA and converting back to RGB
+        frame = self._frame
+        frame.paste(self.context.background_color, box)
+        frame.paste(overlay, mask=overlay)
 
-        return combined.convert("RGB")
+        if self.palette is None:
+            return frame.copy()
 
-    def _draw_watermark(self, draw: ImageDraw.ImageDraw) -> None:
-        """Draw watermark text in the bottom-right corner."""
+        # Map onto the shared palette so the GIF encoder never quantizes frame by frame
+        return frame.quantize(palette=self.palette, dither=Image.Dither.NONE)
+
+    def _build_watermark(self) -> tuple[Image.Image, tuple[int, int]]:
+        """Render the watermark text once as a mask positioned in the bottom-right corner."""
         font = ImageFont.load_default()
-        color = (100, 100, 100, 128)  # Semi-transparent gray
         margin = 5
 
         # Get text bounding box
-        bbox = draw.textbbox((0, 0), WATERMARK_TEXT, font=font)
+        bbox = ImageDraw.Draw(Image.new("L", (1, 1))).textbbox((0, 0), WATERMARK_TEXT, font=font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
+        # Render text at the origin, exactly as draw.text would place it
+        mask = Image.new("L", (bbox[2], bbox[3]), 0)
+        ImageDraw.Draw(mask).text((0, 0), WATERMARK_TEXT, font=font, fill=255)
+
         # Position in bottom-right corner
         x = self.width - text_width - margin
         y = self.height - text_height - margin
+        return mask, (x, y)
 
-        draw.text((x, y), WATERMARK_TEXT, font=font, fill=color)
+    def _draw_watermark(self, draw: ImageDraw.ImageDraw) -> None:
+        """Stamp the pre-rendered watermark text."""
+        draw.bitmap(self._watermark_position, self._watermark_mask, fill=WATERMARK_COLOR)
+
+
+def build_palette(context: RenderContext) -> Image.Image:
+    """
+    Build a single palette covering every color a frame can contain.
+
+    Frames only mix the theme colors over the background (fading bullets,
+    explosions, translucent wings, anti-aliased watermark) plus grey stars,
+    so one fixed palette of those blends serves the whole animation.
+
+    Args:
+        context: Rendering context providing the theme colors
+
+    Returns:
+        A "P" mode image usable with Image.quantize(palette=...)
+    """
+    background = context.background_color
+    colors = [
+        background,
+        context.grid_color,
+        context.ship_color,
+        context.bullet_color,
+        *context.enemy_colors.values(),
+    ]
+    colors += [_blend(context.bullet_color, background, a) for a in range(4, 256, 4)]
+    colors += [_blend(context.ship_color, background, a) for a in range(32, 256, 32)]
+    for enemy_color in context.enemy_colors.values():
+        colors += [_blend(context.bullet_color, enemy_color, a) for a in range(16, 256, 16)]
+    colors += [star_color[:3] for star_color in STAR_COLORS]
+    watermark_rgb, watermark_alpha = WATERMARK_COLOR[:3], WATERMARK_COLOR[3]
+    colors += [_blend(watermark_rgb, background, a) for a in range(8, watermark_alpha + 1, 8)]
+
+    # Drop duplicates and pad with the background up to 256 entries
+    colors = list(dict.fromkeys(colors))[:256]
+    colors += [background] * (256 - len(colors))
+
+    palette = Image.new("P", (1, 1))
+    palette.putpalette([channel for color in colors for channel in color])
+    return palette
+
+
+def _blend(color: tuple[int, ...], background: tuple[int, ...], alpha: int) -> tuple[int, ...]:
+    """Blend color over background with the given alpha (0-255)."""
+    return tuple((c * alpha + b * (255 - alpha)) // 255 for c, b in zip(color, background))
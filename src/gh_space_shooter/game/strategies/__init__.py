@@ -1,14 +1,25 @@
 """Strategy implementations for enemy clearing."""
 
+from types import MappingProxyType
+
 from .base_strategy import Action, BaseStrategy
 from .column_strategy import ColumnStrategy
 from .random_strategy import RandomStrategy
 from .row_strategy import RowStrategy
 
+# Strategy name -> class, shared by the CLI and the web app; read-only so
+# callers cannot register strategies behind each other's back
+STRATEGIES: MappingProxyType[str, type[BaseStrategy]] = MappingProxyType({
+    "column": ColumnStrategy,
+    "row": RowStrategy,
+    "random": RandomStrategy,
+})
+
 __all__ = [
     "BaseStrategy",
     "Action",
     "ColumnStrategy",
     "RowStrategy",
     "RandomStrategy",
+    "STRATEGIES",
 ]
@@ -1,25 +1,29 @@
 """Base strategy interface for enemy clearing strategies."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from ..game_state import GameState
 
 
+@dataclass(frozen=True, slots=True, repr=False)
 class Action:
-    """Represents a single action in the game."""
+    """
+    Represents a single action in the game.
 
-    def __init__(self, x: int, shoot: bool = False):
-        """
-        Initialize an action.
+    Actions are immutable, so strategies can yield the same instance repeatedly.
 
-        Args:
-            x: Week position (0-51) where ship should move
-            shoot: Whether to shoot at this position
-        """
-        self.x = x
-        self.shoot = shoot
+    Attributes:
+        x: Week position (0-51) where ship should move
+        shoot: Whether to shoot at this position
+    """
+
+    x: int
+    shoot: bool = False
 
     def __repr__(self) -> str:
         action_type = "SHOOT" if self.shoot else "MOVE"
@@ -30,7 +34,7 @@ class BaseStrategy(ABC):
     """Abstract base class for enemy clearing strategies."""
 
     @abstractmethod
-    def generate_actions(self, game_state: "GameState") -> Iterator[Action]:
+    def generate_actions(self, game_state: GameState) -> Iterator[Action]:
         """
         Generate sequence of actions for the ship to clear enemies.
 
@@ -1,5 +1,7 @@
 """Column-by-column strategy: Ship moves week by week (left to right)."""
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING, Iterator
 
 from ...constants import NUM_WEEKS
@@ -17,7 +19,7 @@ class ColumnStrategy(BaseStrategy):
     reacting to the actual game state rather than planning ahead.
     """
 
-    def generate_actions(self, game_state: "GameState") -> Iterator[Action]:
+    def generate_actions(self, game_state: GameState) -> Iterator[Action]:
         """
         Generate actions moving week by week, reacting to living enemies.
 
@@ -35,10 +37,10 @@ class ColumnStrategy(BaseStrategy):
         for week_idx in range(NUM_WEEKS):
             # Keep shooting at enemies in this week until none remain
             while True:
-                # Find all living enemies in this week
-                enemies_in_week = [e for e in game_state.enemies if e.x == week_idx]
-                total_health = sum(e.health for e in enemies_in_week)
-                flying_bullets = len([b for b in game_state.bullets if int(b.x) == week_idx])
+                # Remaining health in this week vs. bullets already on their way
+                # (bullet x is already an integer column, no cast needed)
+                total_health = sum(e.health for e in game_state.enemies if e.x == week_idx)
+                flying_bullets = sum(1 for b in game_state.bullets if b.x == week_idx)
 
                 if flying_bullets >= total_health:
                     break
@@ -1,5 +1,7 @@
 """Random strategy: Pick random columns and shoot from bottom up."""
 
+from __future__ import annotations
+
 import random
 from typing import TYPE_CHECKING, Iterator
 
@@ -8,6 +10,9 @@ from .base_strategy import Action, BaseStrategy
 if TYPE_CHECKING:
     from ..game_state import GameState
 
+# Selection weight by distance from the ship: 0, 1-3, then 4 or more columns
+_WEIGHT_BY_DISTANCE = (10, 100, 100, 100, 1)
+
 
 class RandomStrategy(BaseStrategy):
     """
@@ -17,13 +22,13 @@ class RandomStrategy(BaseStrategy):
     creating a balanced mix of efficiency and unpredictability.
     """
 
-    def generate_actions(self, game_state: "GameState") -> Iterator[Action]:
+    def generate_actions(self, game_state: GameState) -> Iterator[Action]:
         """
         Generate actions using weighted random selection based on distance.
 
         Sorts columns by distance, takes the 8 closest, and applies weights:
-        - Distance 0 (same position): weight 3
-        - Distance 1-3: weight 5 (highest priority)
+        - Distance 0 (same position): weight 10
+        - Distance 1-3: weight 100 (highest priority)
         - Distance 4+: weight 1 (lowest priority)
 
         Args:
@@ -33,29 +38,34 @@ class RandomStrategy(BaseStrategy):
             Action objects representing ship movements and shots
         """
         while game_state.enemies:
-            columns_with_enemies = list(set(e.x for e in game_state.enemies))
+            # Candidates are recomputed once per target (not per shot): the ship
+            # moves between targets, so the distance ordering changes anyway
+            columns_with_enemies = {e.x for e in game_state.enemies}
+            # The ship has finished moving, so it sits on a whole column
             ship_x = game_state.ship.x
 
             # Take the first 8 closest columns
             columns_by_distance = sorted(columns_with_enemies, key=lambda col: abs(col - ship_x))
             candidate_columns = columns_by_distance[:8]
 
-            # Assign weights based on distance
-            weights = []
+            # Accumulate weights based on distance while scanning the candidates,
+            # so random.choices does not have to build the running totals itself
+            cum_weights = []
+            total = 0
             for col in candidate_columns:
-                distance = abs(col - ship_x)
-                if distance == 0:
-                    weights.append(10)
-                elif 1 <= distance <= 3:
-                    weights.append(100)
-                else:  # distance >= 4
-                    weights.append(1)
+                total += _WEIGHT_BY_DISTANCE[min(int(abs(col - ship_x)), 4)]
+                cum_weights.append(total)
 
             # Choose randomly with weights
-            target_column = random.choices(candidate_columns, weights=weights)[0]
+            target_column = random.choices(candidate_columns, cum_weights=cum_weights)[0]
 
-            enemies_in_column = [e for e in game_state.enemies if e.x == target_column]
-            lowest_enemy = max(enemies_in_column, key=lambda e: e.y)
+            # Find the lowest enemy (highest y) in one pass; ties keep the first
+            lowest_enemy = None
+            for enemy in game_state.enemies:
+                if enemy.x == target_column and (lowest_enemy is None or enemy.y > lowest_enemy.y):
+                    lowest_enemy = enemy
 
+            # Every shot of the burst is the same immutable action
+            shot = Action(x=target_column, shoot=True)
             for _ in range(lowest_enemy.health):
-                yield Action(x=target_column, shoot=True)
+                yield shot
@@ -1,5 +1,7 @@
 """Row-by-row strategy: Process enemies row by row (day by day)."""
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING, Iterator
 
 from ...constants import NUM_DAYS
@@ -17,7 +19,7 @@ class RowStrategy(BaseStrategy):
     and shoots until all enemies in the row are destroyed.
     """
 
-    def generate_actions(self, game_state: "GameState") -> Iterator[Action]:
+    def generate_actions(self, game_state: GameState) -> Iterator[Action]:
         """
         Generate actions processing enemies row by row.
 
@@ -1,17 +1,25 @@
 """Output providers for different animation formats."""
 
-from pathlib import Path
+import os
+from types import MappingProxyType
+
 from .base import OutputProvider
 from .gif_provider import GifOutputProvider
 from .webp_provider import WebPOutputProvider
 from .webp_dataurl_provider import WebpDataUrlOutputProvider
 
 
-# Extension -> Provider class mapping
-_PROVIDER_MAP: dict[str, type[OutputProvider]] = {
+# Extension -> Provider class mapping, frozen so the supported list below stays accurate
+_PROVIDER_MAP: MappingProxyType[str, type[OutputProvider]] = MappingProxyType({
     ".gif": GifOutputProvider,
     ".webp": WebPOutputProvider,
-}
+})
+_SUPPORTED_FORMATS = ", ".join(_PROVIDER_MAP)
+
+
+def _infer_ext(file_path: str) -> str:
+    """Return the lowercased extension of a path, including the leading dot."""
+    return os.path.splitext(file_path)[1].lower()
 
 
 def resolve_output_provider(
@@ -29,15 +37,14 @@ def resolve_output_provider(
     Raises:
         ValueError: If file extension is not supported
     """
-    ext = Path(file_path).suffix.lower()
+    ext = _infer_ext(file_path)
+    provider_class = _PROVIDER_MAP.get(ext)
 
-    if ext not in _PROVIDER_MAP:
-        supported = ", ".join(_PROVIDER_MAP.keys())
+    if provider_class is None:
         raise ValueError(
-            f"Unsupported output format: {ext}. Supported formats: {supported}"
+            f"Unsupported output format: {ext}. Supported formats: {_SUPPORTED_FORMATS}"
         )
 
-    provider_class = _PROVIDER_MAP[ext]
     return provider_class(file_path)
 
 
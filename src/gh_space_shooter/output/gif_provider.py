@@ -28,15 +28,16 @@ class GifOutputProvider(OutputProvider):
         Returns:
             GIF-encoded bytes
         """
-        frame_list = list(frames)
         buffer = BytesIO()
+        first_frame = next(frames, None)
 
-        if frame_list:
-            frame_list[0].save(
+        if first_frame is not None:
+            # Hand Pillow the iterator so frames are quantized as they arrive
+            first_frame.save(
                 buffer,
                 format="gif",
                 save_all=True,
-                append_images=frame_list[1:],
+                append_images=frames,
                 duration=frame_duration,
                 loop=0,
                 optimize=True,
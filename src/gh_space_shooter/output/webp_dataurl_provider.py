@@ -2,10 +2,10 @@
 
 import base64
 import os
-from io import BytesIO
 from typing import Iterator
 from PIL import Image
 from .base import OutputProvider
+from .webp_provider import encode_webp
 
 
 # Section markers for injection mode
@@ -36,27 +36,11 @@ class WebpDataUrlOutputProvider(OutputProvider):
         Returns:
             The data URL string as bytes (for consistency with other providers)
         """
-        frame_list = list(frames)
+        webp_bytes = encode_webp(frames, frame_duration)
 
-        if not frame_list:
+        if not webp_bytes:
             data_url = ""
         else:
-            # Encode as WebP using same settings as WebPOutputProvider
-            buffer = BytesIO()
-            frame_list[0].save(
-                buffer,
-                format="webp",
-                save_all=True,
-                append_images=frame_list[1:],
-                duration=frame_duration,
-                loop=0,
-                lossless=False,
-                quality=85,
-                method=6,
-            )
-
-            # Convert to data URL
-            webp_bytes = buffer.getvalue()
             base64_data = base64.b64encode(webp_bytes).decode("ascii")
             data_url = f"data:image/webp;base64,{base64_data}"
 
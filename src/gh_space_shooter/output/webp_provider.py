@@ -5,6 +5,16 @@ from typing import Iterator
 from PIL import Image
 from .base import OutputProvider
 
+# method=6 spends ~20x longer than method=5 on animations for no size win;
+# a 9-17 frame keyframe interval lets most frames be stored as deltas.
+WEBP_SAVE_OPTIONS = {
+    "lossless": False,
+    "quality": 85,
+    "method": 5,
+    "kmin": 9,
+    "kmax": 17,
+}
+
 
 class WebPOutputProvider(OutputProvider):
     """Output provider for WebP format."""
@@ -28,23 +38,7 @@ class WebPOutputProvider(OutputProvider):
         Returns:
             WebP-encoded bytes
         """
-        frame_list = list(frames)
-        buffer = BytesIO()
-
-        if frame_list:
-            frame_list[0].save(
-                buffer,
-                format="webp",
-                save_all=True,
-                append_images=frame_list[1:],
-                duration=frame_duration,
-                loop=0,
-                lossless=False,
-                quality=85,
-                method=6,
-            )
-
-        return buffer.getvalue()
+        return encode_webp(frames, frame_duration)
 
     def write(self, data: bytes) -> None:
         """
@@ -55,3 +49,31 @@ class WebPOutputProvider(OutputProvider):
         """
         with open(self.path, "wb") as f:
             f.write(data)
+
+
+def encode_webp(frames: Iterator[Image.Image], frame_duration: int) -> bytes:
+    """
+    Encode frames as animated WebP, shared by the WebP based providers.
+
+    Args:
+        frames: Iterator of PIL Images
+        frame_duration: Duration of each frame in milliseconds
+
+    Returns:
+        WebP-encoded bytes, empty if there were no frames
+    """
+    first_frame = next(frames, None)
+    if first_frame is None:
+        return b""
+
+    buffer = BytesIO()
+    first_frame.save(
+        buffer,
+        format="webp",
+        save_all=True,
+        append_images=frames,
+        duration=frame_duration,
+        loop=0,
+        **WEBP_SAVE_OPTIONS,
+    )
+    return buffer.getvalue()
@@ -1,6 +1,11 @@
 """Tests for Animator."""
 
-from gh_space_shooter.game import Animator, ColumnStrategy
+import itertools
+import time
+
+import pytest
+
+from gh_space_shooter.game import Animator, ColumnStrategy, buffered_frames
 from gh_space_shooter.github_client import ContributionData
 
 
@@ -33,3 +38,72 @@ def test_generate_frames_returns_iterator():
 
     assert len(frames) > 0
     assert all(hasattr(f, "save") for f in frames)  # PIL Images have save method
+
+
+def test_generate_frames_respects_max_frames():
+    """generate_frames should stop at max_frames, or at the end if that comes first."""
+    animator = Animator(SAMPLE_DATA, ColumnStrategy(), fps=30)
+    total = len(list(animator.generate_frames()))
+
+    assert len(list(animator.generate_frames(max_frames=3))) == 3
+    assert len(list(animator.generate_frames(max_frames=total + 10))) == total
+
+
+def test_generate_frames_rgb_by_default():
+    """Frames should stay full RGB unless quantization is requested."""
+    animator = Animator(SAMPLE_DATA, ColumnStrategy(), fps=30)
+
+    frames = list(animator.generate_frames(max_frames=5))
+
+    assert all(f.mode == "RGB" for f in frames)
+
+
+def test_generate_frames_share_palette():
+    """Quantized frames should all use a single shared palette."""
+    animator = Animator(SAMPLE_DATA, ColumnStrategy(), fps=30, quantize=True)
+
+    frames = list(animator.generate_frames(max_frames=5))
+
+    assert all(f.mode == "P" for f in frames)
+    assert all(f.getpalette() == frames[0].getpalette() for f in frames)
+
+
+def test_buffered_frames_preserves_order():
+    """buffered_frames should yield every frame in the original order."""
+    assert list(buffered_frames(iter(range(20)), maxsize=2)) == list(range(20))
+
+
+def test_buffered_frames_propagates_errors():
+    """buffered_frames should re-raise errors from the producing iterator."""
+
+    def failing():
+        yield 1
+        raise RuntimeError("boom")
+
+    frames = buffered_frames(failing())
+    assert next(frames) == 1
+    with pytest.raises(RuntimeError, match="boom"):
+        next(frames)
+
+
+def test_buffered_frames_stops_producer_on_close():
+    """Closing buffered_frames early should stop the producer from advancing."""
+    produced = []
+
+    def counting():
+        for i in itertools.count():
+            produced.append(i)
+            yield i
+
+    frames = buffered_frames(counting(), maxsize=2)
+    assert [next(frames) for _ in range(3)] == [0, 1, 2]
+    frames.close()
+
+    # Give the worker a few put() polling intervals to notice the stop
+    time.sleep(0.3)
+    stopped_at = len(produced)
+    time.sleep(0.3)
+
+    assert len(produced) == stopped_at
+    # Consumed items, a full buffer, one blocked put and one last pull
+    assert stopped_at <= 3 + 2 + 1 + 1
@@ -1,7 +1,7 @@
 """Tests for bullet collision detection logic."""
 
 from gh_space_shooter.game.game_state import GameState
-from gh_space_shooter.game.drawables import Bullet, Enemy
+from gh_space_shooter.game.drawables import Bullet, Enemy, Explosion
 from gh_space_shooter.constants import DEFAULT_FPS, EXPLOSION_DURATION_SMALL, EXPLOSION_DURATION_LARGE
 
 # Delta time for tests (1/fps seconds per frame)
@@ -15,7 +15,7 @@ class TestBulletCollision:
         """Test that bullet detects collision when at same x position as enemy."""
 
         enemy = Enemy(x=5, y=3, health=2, game_state=default_game_state)
-        default_game_state.enemies.append(enemy)
+        default_game_state.add_enemy(enemy)
         bullet = Bullet(x=5, game_state=default_game_state)
         bullet.y = 2.0
         default_game_state.bullets.append(bullet)
@@ -23,14 +23,14 @@ class TestBulletCollision:
         hit_enemy = bullet._check_collision()
         assert hit_enemy is enemy
 
-        bullet.animate(TEST_DELTA_TIME)
+        default_game_state.animate(TEST_DELTA_TIME)
         assert bullet not in default_game_state.bullets
 
     def test_collision_detection_enemy_above_bullet(self, default_game_state: GameState) -> None:
         """Test that collision is detected when enemy.y >= bullet.y."""
 
         enemy = Enemy(x=5, y=3, health=2, game_state=default_game_state)
-        default_game_state.enemies.append(enemy)
+        default_game_state.add_enemy(enemy)
         bullet = Bullet(x=5, game_state=default_game_state)
         bullet.y = 2.5
         default_game_state.bullets.append(bullet)
@@ -38,14 +38,14 @@ class TestBulletCollision:
         hit_enemy = bullet._check_collision()
         assert hit_enemy is enemy
 
-        bullet.animate(TEST_DELTA_TIME)
+        default_game_state.animate(TEST_DELTA_TIME)
         assert bullet not in default_game_state.bullets
 
     def test_no_collision_different_x_position(self, default_game_state: GameState) -> None:
         """Test that bullet doesn't detect collision at different x positions."""
 
         enemy = Enemy(x=5, y=3, health=2, game_state=default_game_state)
-        default_game_state.enemies.append(enemy)
+        default_game_state.add_enemy(enemy)
 
         bullet = Bullet(x=6, game_state=default_game_state)
         bullet.y = 3.0
@@ -57,7 +57,7 @@ class TestBulletCollision:
         """Test that bullet damages enemy on collision."""
 
         enemy = Enemy(x=5, y=3, health=3, game_state=default_game_state)
-        default_game_state.enemies.append(enemy)
+        default_game_state.add_enemy(enemy)
 
         bullet = Bullet(x=5, game_state=default_game_state)
         bullet.y = 2.0
@@ -70,7 +70,7 @@ class TestBulletCollision:
         """Test that enemy is removed when health reaches zero."""
 
         enemy = Enemy(x=5, y=3, health=1, game_state=default_game_state)
-        default_game_state.enemies.append(enemy)
+        default_game_state.add_enemy(enemy)
 
         bullet = Bullet(x=5, game_state=default_game_state)
         bullet.y = 2.0
@@ -78,12 +78,27 @@ class TestBulletCollision:
 
         bullet.animate(TEST_DELTA_TIME)
         assert enemy not in default_game_state.enemies
+        assert 5 not in default_game_state.enemies_by_x
+
+    def test_bullet_ignores_enemies_in_other_columns(self, default_game_state: GameState) -> None:
+        """Test that bullet only collides with enemies in its own column."""
+
+        enemy = Enemy(x=6, y=3, health=2, game_state=default_game_state)
+        default_game_state.add_enemy(enemy)
+
+        bullet = Bullet(x=5, game_state=default_game_state)
+        bullet.y = 2.0
+        default_game_state.bullets.append(bullet)
+
+        bullet.animate(TEST_DELTA_TIME)
+        assert enemy.health == 2
+        assert not bullet.dead
 
     def test_explosion_created_on_collision(self, default_game_state: GameState) -> None:
         """Test that explosion is created when bullet hits enemy."""
 
         enemy = Enemy(x=5, y=3, health=2, game_state=default_game_state)
-        default_game_state.enemies.append(enemy)
+        default_game_state.add_enemy(enemy)
 
         bullet = Bullet(x=5, game_state=default_game_state)
         bullet.y = 2.0
@@ -97,7 +112,7 @@ class TestBulletCollision:
         """Test that large explosion is created when enemy is destroyed."""
 
         enemy = Enemy(x=5, y=3, health=1, game_state=default_game_state)
-        default_game_state.enemies.append(enemy)
+        default_game_state.add_enemy(enemy)
 
         bullet = Bullet(x=5, game_state=default_game_state)
         bullet.y = 2.0
@@ -118,7 +133,28 @@ class TestBulletCollision:
         default_game_state.bullets.append(bullet)
 
         for _ in range(50):
-            if bullet in default_game_state.bullets:
-                bullet.animate(TEST_DELTA_TIME)
+            default_game_state.animate(TEST_DELTA_TIME)
 
         assert bullet not in default_game_state.bullets
+
+    def test_all_finished_bullets_removed_in_same_frame(self, default_game_state: GameState) -> None:
+        """Test that consecutive bullets finishing in one frame are all removed."""
+
+        bullets = [Bullet(x=5, game_state=default_game_state) for _ in range(3)]
+        for bullet in bullets:
+            bullet.y = -9.99
+        default_game_state.bullets.extend(bullets)
+
+        default_game_state.animate(TEST_DELTA_TIME)
+
+        assert default_game_state.bullets == []
+
+    def test_all_finished_explosions_removed_in_same_frame(self, default_game_state: GameState) -> None:
+        """Test that consecutive explosions finishing in one frame are all removed."""
+
+        explosions = [Explosion(5, 3, "small", default_game_state) for _ in range(3)]
+        default_game_state.explosions.extend(explosions)
+
+        default_game_state.animate(EXPLOSION_DURATION_SMALL)
+
+        assert default_game_state.explosions == []
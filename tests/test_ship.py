@@ -0,0 +1,71 @@
+"""Tests for ship rendering."""
+
+import pytest
+from PIL import Image, ImageDraw
+
+from gh_space_shooter.constants import SHIP_POSITION_Y
+from gh_space_shooter.game.game_state import GameState
+from gh_space_shooter.game.render_context import RenderContext
+
+
+def _draw_ship_directly(draw: ImageDraw.ImageDraw, ship_x: float, context: RenderContext) -> None:
+    """Rasterize the ship polygons straight onto the frame, without cached masks."""
+    x, y = context.get_cell_position(ship_x, SHIP_POSITION_Y)
+    center_x = x + context.cell_size // 2
+    height = context.cell_size
+    wing_width = 8
+    translucent = (*context.ship_color, 128)
+
+    draw.polygon(
+        [
+            (center_x - 2, y + height * 0.5),
+            (center_x - wing_width, y + height * 0.8),
+            (center_x - wing_width, y + height * 1),
+            (center_x - 2, y + height * 0.7),
+        ],
+        fill=translucent
+    )
+    draw.rectangle(
+        [center_x - wing_width - 1, y + height * 0.5, center_x - wing_width, y + height * 1],
+        fill=context.ship_color
+    )
+    draw.polygon(
+        [
+            (center_x + 2, y + height * 0.5),
+            (center_x + wing_width, y + height * 0.8),
+            (center_x + wing_width, y + height * 1),
+            (center_x + 2, y + height * 0.7),
+        ],
+        fill=translucent
+    )
+    draw.rectangle(
+        [center_x + wing_width, y + height * 0.5, center_x + wing_width + 1, y + height * 1],
+        fill=context.ship_color
+    )
+    draw.polygon(
+        [
+            (center_x, y),
+            (center_x - 3, y + height * 0.7),
+            (center_x, y + height),
+            (center_x + 3, y + height * 0.7),
+        ],
+        fill=context.ship_color
+    )
+
+
+@pytest.mark.parametrize("ship_x", [25, 25.37])
+def test_ship_draw_matches_direct_rasterization(default_game_state: GameState, ship_x: float) -> None:
+    """Stamping the cached masks should give the same pixels as drawing the polygons."""
+    context = RenderContext.darkmode()
+    size = (context.padding * 2 + 60 * context.cell_pitch, context.padding * 2 + 10 * context.cell_pitch)
+    ship = default_game_state.ship
+    ship.x = ship_x
+
+    stamped = Image.new("RGBA", size, (0, 0, 0, 0))
+    ship.draw(ImageDraw.Draw(stamped, "RGBA"), context)
+
+    expected = Image.new("RGBA", size, (0, 0, 0, 0))
+    _draw_ship_directly(ImageDraw.Draw(expected, "RGBA"), ship_x, context)
+
+    assert stamped.getbbox() is not None
+    assert stamped.tobytes() == expected.tobytes()